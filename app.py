@@ -1,5 +1,7 @@
 import streamlit as st
+import re
 import sqlite3
+import threading
 import pandas as pd
 from datetime import datetime
 
@@ -10,6 +12,17 @@ from datetime import datetime
 # Database file name
 DATABASE = "data.db"
 
+# SQL statements, defined once so every call passes the same string to the
+# connection's prepared statement cache
+_SQL_INSERT = "INSERT INTO users (name, email, phone, age) VALUES (?, ?, ?, ?)"
+_SQL_SELECT_ALL = "SELECT id, name, email, phone, age, created_at FROM users ORDER BY id DESC"
+_SQL_SELECT_SUMMARY = "SELECT id, name, email, phone, age FROM users ORDER BY id DESC"
+_SQL_UPDATE = "UPDATE users SET name = ?, email = ?, phone = ?, age = ? WHERE id = ?"
+_SQL_DELETE = "DELETE FROM users WHERE id = ?"
+
+# Email format check, compiled once: one "@", no whitespace, a dot in the domain
+_EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+
 # Initialize database connection and create table if it doesn't exist
 def init_database():
     """
@@ -19,11 +32,17 @@ def init_database():
     - name: Text field
     - email: Text field
     - phone: Text field
+    - age: Integer field
     - created_at: Timestamp
+    An index on email is also created.
     """
     conn = sqlite3.connect(DATABASE)
     cursor = conn.cursor()
     
+    # Write-ahead logging (stored in the database file, so it persists for
+    # every later connection); readers no longer block writers
+    cursor.execute("PRAGMA journal_mode=WAL")
+    
     # Create table if it doesn't exist
     cursor.execute("""
         CREATE TABLE IF NOT EXISTS users (
@@ -36,16 +55,97 @@ def init_database():
         )
     """)
     
+    # Index for email lookups. ORDER BY id DESC needs no extra index:
+    # id is the rowid, which SQLite already scans in reverse without a sort.
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_users_email ON users (email)")
+    
+    # Refresh planner statistics (init runs once per server start)
+    cursor.execute("ANALYZE")
+    
     conn.commit()
     conn.close()
 
+@st.cache_resource(show_spinner=False)
+def _db_ready():
+    """Run init_database() once per server process."""
+    init_database()
+    return True
+
+# =====================================================
+# VALIDATION
+# =====================================================
+
+def validate_record(name, email, phone, age):
+    """
+    Check a record's fields before it is written to the database.
+    
+    Args:
+        name (str): Stripped name
+        email (str): Stripped email
+        phone (str): Stripped phone number
+        age (int): Age, or None if missing
+    
+    Returns:
+        list: Names of the invalid fields (empty if the record is valid)
+    """
+    errors = []
+    if not name:
+        errors.append("Name")
+    if not _EMAIL_RE.match(email):
+        errors.append("Email")
+    if not phone:
+        errors.append("Phone")
+    if age is None or not 1 <= age <= 120:
+        errors.append("Age")
+    return errors
+
 # =====================================================
 # CRUD OPERATIONS
 # =====================================================
 
+@st.cache_resource
 def get_connection():
-    """Get a database connection."""
-    return sqlite3.connect(DATABASE)
+    """
+    Get the shared database connection.
+    
+    The connection is opened once per server process and reused across
+    reruns and sessions, keeping SQLite's page cache warm. It runs in
+    autocommit mode, so each write statement commits on its own.
+    Type detection is off: created_at is shown as stored text, so rows
+    are returned without going through sqlite3's converter registry.
+    """
+    conn = sqlite3.connect(
+        DATABASE,
+        check_same_thread=False,
+        isolation_level=None,
+        cached_statements=128,
+        detect_types=0
+    )
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA cache_size=-64000")
+    return conn
+
+@st.cache_resource
+def get_db_lock():
+    """
+    Get the lock that serializes statements on the shared connection.
+    
+    Reads take it too: otherwise a read from another session could see
+    (and cache) rows from an uncommitted bulk insert that later rolls back.
+    """
+    return threading.Lock()
+
+def bump_data_version():
+    """
+    Mark the table as changed after a successful write.
+    
+    Bumps the session's data version (the cache key for read queries) and
+    drops cached query results so other sessions also see the change.
+    """
+    st.session_state.data_version = st.session_state.get("data_version", 0) + 1
+    st.cache_data.clear()
 
 def insert_record(name, email, phone, age):
     """
@@ -62,18 +162,111 @@ def insert_record(name, email, phone, age):
     """
     try:
         conn = get_connection()
-        cursor = conn.cursor()
-        cursor.execute("""
-            INSERT INTO users (name, email, phone, age)
-            VALUES (?, ?, ?, ?)
-        """, (name, email, phone, age))
-        conn.commit()
-        conn.close()
+        with get_db_lock():
+            conn.execute(_SQL_INSERT, (name, email, phone, age))
+        bump_data_version()
         return True
     except Exception as e:
         st.error(f"Error inserting record: {e}")
         return False
 
+def insert_records(rows):
+    """
+    INSERT operation: Add many records in a single transaction.
+    
+    Args:
+        rows (iterable): Tuples of (name, email, phone, age)
+    
+    Returns:
+        bool: True if successful, False otherwise
+    """
+    try:
+        conn = get_connection()
+        with get_db_lock():
+            conn.execute("BEGIN")
+            with conn:
+                conn.executemany(_SQL_INSERT, rows)
+        bump_data_version()
+        return True
+    except Exception as e:
+        st.error(f"Error inserting records: {e}")
+        return False
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _view_all_records_cached(version):
+    """
+    Run the full table query. Results are cached per data version, so
+    reruns reuse the DataFrame until a write bumps the version. Entries
+    also expire after 60 seconds to bound staleness, e.g. from changes
+    made outside the app.
+    
+    Args:
+        version (int): Current data version (cache key only)
+    
+    Returns:
+        pd.DataFrame: DataFrame containing all records
+    """
+    with get_db_lock():
+        cursor = get_connection().execute(_SQL_SELECT_ALL)
+        columns = [col[0] for col in cursor.description]
+        rows = cursor.fetchall()
+    return pd.DataFrame(rows, columns=columns)
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _list_summary_cached(version):
+    """
+    Run the summary query. Cached per data version like the full view.
+    
+    Args:
+        version (int): Current data version (cache key only)
+    
+    Returns:
+        pd.DataFrame: DataFrame of record summaries
+    """
+    with get_db_lock():
+        cursor = get_connection().execute(_SQL_SELECT_SUMMARY)
+        columns = [col[0] for col in cursor.description]
+        rows = cursor.fetchall()
+    return pd.DataFrame(rows, columns=columns)
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _record_options_cached(version):
+    """
+    Build the Update/Delete selector options from the summary query.
+    Cached per data version, so labels are formatted once per change
+    instead of on every rerun.
+    
+    Args:
+        version (int): Current data version (cache key only)
+    
+    Returns:
+        tuple: (ids, labels, records) where labels maps id -> selectbox
+            label and records maps id -> (name, email, phone, age)
+    """
+    df = _list_summary_cached(version)
+    ids = df["id"].tolist()
+    names = df["name"].tolist()
+    emails = df["email"].tolist()
+    # Convert ages back from pandas floats/NaN to int/None
+    ages = [int(a) if pd.notna(a) else None for a in df["age"]]
+    labels = {i: f"ID: {i} - {n} ({e})" for i, n, e in zip(ids, names, emails)}
+    records = dict(zip(ids, zip(names, emails, df["phone"].tolist(), ages)))
+    return ids, labels, records
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _records_csv(version):
+    """
+    Serialize all records to CSV. Cached per data version, so the export
+    is only rebuilt after the data changes.
+    
+    Args:
+        version (int): Current data version (cache key only)
+    
+    Returns:
+        bytes: UTF-8 encoded CSV data
+    """
+    return _view_all_records_cached(version).to_csv(index=False).encode()
+
 def view_all_records():
     """
     READ operation: Fetch all records from the database.
@@ -82,37 +275,23 @@ def view_all_records():
         pd.DataFrame: DataFrame containing all records
     """
     try:
-        conn = get_connection()
-        query = "SELECT id, name, email, phone, age, created_at FROM users ORDER BY id DESC"
-        df = pd.read_sql_query(query, conn)
-        conn.close()
-        return df
+        return _view_all_records_cached(st.session_state.data_version)
     except Exception as e:
         st.error(f"Error reading records: {e}")
         return pd.DataFrame()
 
-def view_record_by_id(record_id):
+def record_options():
     """
-    Fetch a single record by ID.
-    
-    Args:
-        record_id (int): The ID of the record to fetch
+    Get the options for the Update and Delete record selectors.
     
     Returns:
-        tuple: Record data (name, email, phone, age) or None
+        tuple: (ids, labels, records) as built by _record_options_cached
     """
     try:
-        conn = get_connection()
-        cursor = conn.cursor()
-        cursor.execute("""
-            SELECT name, email, phone, age FROM users WHERE id = ?
-        """, (record_id,))
-        record = cursor.fetchone()
-        conn.close()
-        return record
+        return _record_options_cached(st.session_state.data_version)
     except Exception as e:
-        st.error(f"Error fetching record: {e}")
-        return None
+        st.error(f"Error reading records: {e}")
+        return [], {}, {}
 
 def update_record(record_id, name, email, phone, age):
     """
@@ -130,13 +309,9 @@ def update_record(record_id, name, email, phone, age):
     """
     try:
         conn = get_connection()
-        cursor = conn.cursor()
-        cursor.execute("""
-            UPDATE users SET name = ?, email = ?, phone = ?, age = ?
-            WHERE id = ?
-        """, (name, email, phone, age, record_id))
-        conn.commit()
-        conn.close()
+        with get_db_lock():
+            conn.execute(_SQL_UPDATE, (name, email, phone, age, record_id))
+        bump_data_version()
         return True
     except Exception as e:
         st.error(f"Error updating record: {e}")
@@ -154,21 +329,74 @@ def delete_record(record_id):
     """
     try:
         conn = get_connection()
-        cursor = conn.cursor()
-        cursor.execute("DELETE FROM users WHERE id = ?", (record_id,))
-        conn.commit()
-        conn.close()
+        with get_db_lock():
+            conn.execute(_SQL_DELETE, (record_id,))
+        bump_data_version()
         return True
     except Exception as e:
         st.error(f"Error deleting record: {e}")
         return False
 
+# =====================================================
+# UI CONFIGURATION
+# =====================================================
+
+@st.cache_resource
+def get_column_config():
+    """
+    Get the column configuration for the records table.
+    
+    Streamlit re-executes this script on every rerun, so the config is
+    cached as a resource to build it once per server process.
+    """
+    return {
+        "id": st.column_config.NumberColumn("ID", width="small"),
+        "name": st.column_config.TextColumn("Name", width="medium"),
+        "email": st.column_config.TextColumn("Email", width="large"),
+        "phone": st.column_config.TextColumn("Phone", width="medium"),
+        "created_at": st.column_config.TextColumn("Created At", width="medium")
+    }
+
+@st.fragment
+def _render_record_grid():
+    """
+    Render the records table and CSV export.
+    
+    Runs as a fragment, so interacting with its widgets reruns only this
+    function instead of the whole script.
+    """
+    df = view_all_records()
+    
+    if df.empty:
+        st.info("No records found. Start by adding a new record!")
+    else:
+        st.subheader(f"Total Records: {len(df)}")
+        # Display records in a dataframe
+        st.dataframe(
+            df,
+            use_container_width=True,
+            hide_index=True,
+            column_config=get_column_config()
+        )
+        
+        # Option to export data
+        st.divider()
+        st.download_button(
+            label="📥 Download as CSV",
+            data=_records_csv(st.session_state.data_version),
+            file_name=f"users_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
+            mime="text/csv"
+        )
+
 # =====================================================
 # STREAMLIT UI
 # =====================================================
 
-# Initialize database on app startup
-init_database()
+# Initialize database once per server process, not on every rerun
+_db_ready()
+
+# Data version used as the cache key for read queries
+st.session_state.setdefault("data_version", 0)
 
 # Set page configuration
 st.set_page_config(
@@ -186,7 +414,7 @@ st.markdown("A clean and simple interface to manage user records with full CRUD
 st.sidebar.header("Navigation")
 operation = st.sidebar.radio(
     "Choose an operation:",
-    ["📖 View Records", "➕ Add Record", "✏️ Update Record", "🗑️ Delete Record"]
+    ["📖 View Records", "➕ Add Record", "📤 Bulk Add (CSV)", "✏️ Update Record", "🗑️ Delete Record"]
 )
 
 # =====================================================
@@ -194,44 +422,16 @@ operation = st.sidebar.radio(
 # =====================================================
 if operation == "📖 View Records":
     st.header("📖 View All Records")
-    st.markdown("---")
+    st.divider()
     
-    df = view_all_records()
-    
-    if df.empty:
-        st.info("No records found. Start by adding a new record!")
-    else:
-        st.subheader(f"Total Records: {len(df)}")
-        # Display records in a dataframe
-        st.dataframe(
-            df,
-            use_container_width=True,
-            hide_index=True,
-            column_config={
-                "id": st.column_config.NumberColumn("ID", width="small"),
-                "name": st.column_config.TextColumn("Name", width="medium"),
-                "email": st.column_config.TextColumn("Email", width="large"),
-                "phone": st.column_config.TextColumn("Phone", width="medium"),
-                "created_at": st.column_config.TextColumn("Created At", width="medium")
-            }
-        )
-        
-        # Option to export data
-        st.markdown("---")
-        csv = df.to_csv(index=False)
-        st.download_button(
-            label="📥 Download as CSV",
-            data=csv,
-            file_name=f"users_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-            mime="text/csv"
-        )
+    _render_record_grid()
 
 # =====================================================
 # OPERATION: ADD RECORD
 # =====================================================
 elif operation == "➕ Add Record":
     st.header("➕ Add a New Record")
-    st.markdown("---")
+    st.divider()
     
     # Create a form for adding a new record
     with st.form(key="add_form", clear_on_submit=True):
@@ -276,47 +476,120 @@ elif operation == "➕ Add Record":
         
         # Handle form submission
         if submit_button:
-            # Validation
-            if not name.strip():
-                st.error("❌ Name cannot be empty!")
-            elif not email.strip():
-                st.error("❌ Email cannot be empty!")
-            elif not phone.strip():
-                st.error("❌ Phone cannot be empty!")
-            elif "@" not in email:
-                st.error("❌ Please enter a valid email address!")
-            elif age < 1:
-                st.error("❌ Age must be at least 1!")
+            # Validation: strip once, collect every invalid field
+            name_s, email_s, phone_s = name.strip(), email.strip(), phone.strip()
+            errors = validate_record(name_s, email_s, phone_s, age)
+            
+            if errors:
+                st.error("❌ Invalid: " + ", ".join(errors))
             else:
                 # Insert record
-                if insert_record(name, email, phone, age):
-                    st.success(f"✅ Record added successfully! Name: {name}, Age: {age}")
+                if insert_record(name_s, email_s, phone_s, age):
+                    st.success(f"✅ Record added successfully! Name: {name_s}, Age: {age}")
                 else:
                     st.error("❌ Failed to add record.")
 
+# =====================================================
+# OPERATION: BULK ADD (CSV UPLOAD)
+# =====================================================
+elif operation == "📤 Bulk Add (CSV)":
+    st.header("📤 Bulk Add Records from CSV")
+    st.divider()
+    
+    st.markdown("Upload a CSV file with the columns `name`, `email`, `phone` and `age`.")
+    
+    # Result of the last import, shown once after the uploader is reset
+    if "bulk_add_message" in st.session_state:
+        st.success(st.session_state.pop("bulk_add_message"))
+    
+    # Changing the key after an import gives a fresh, empty uploader, so
+    # the same file cannot be imported twice
+    uploaded_file = st.file_uploader(
+        "Choose a CSV file",
+        type="csv",
+        key=f"bulk_upload_{st.session_state.setdefault('bulk_upload_key', 0)}"
+    )
+    
+    if uploaded_file is not None:
+        try:
+            upload_df = pd.read_csv(
+                uploaded_file,
+                dtype={"name": str, "email": str, "phone": str}
+            )
+        except Exception as e:
+            st.error(f"❌ Could not read CSV file: {e}")
+            upload_df = None
+        
+        if upload_df is not None:
+            required_columns = ["name", "email", "phone", "age"]
+            missing_columns = [col for col in required_columns if col not in upload_df.columns]
+            
+            if missing_columns:
+                st.error(f"❌ Missing columns: {', '.join(missing_columns)}")
+            elif upload_df.empty:
+                st.info("The uploaded file contains no records.")
+            else:
+                upload_df = upload_df[required_columns].copy()
+                for col in ["name", "email", "phone"]:
+                    upload_df[col] = upload_df[col].fillna("").str.strip()
+                # Non-numeric ages become NaN and fail validation below
+                upload_df["age"] = pd.to_numeric(upload_df["age"], errors="coerce")
+                
+                st.subheader(f"Records to Import: {len(upload_df)}")
+                st.dataframe(upload_df, use_container_width=True, hide_index=True)
+                
+                # Run every row through the same checks as the Add form;
+                # data rows are numbered from 1, matching the preview above
+                rows, bad_rows = [], []
+                for row_number, (row_name, row_email, row_phone, row_age) in enumerate(
+                    upload_df.itertuples(index=False, name=None), start=1
+                ):
+                    if pd.notna(row_age) and float(row_age).is_integer():
+                        row_age = int(row_age)
+                    else:
+                        row_age = None
+                    errors = validate_record(row_name, row_email, row_phone, row_age)
+                    if errors:
+                        bad_rows.append(f"- Row {row_number}: {', '.join(errors)}")
+                    else:
+                        rows.append((row_name, row_email, row_phone, row_age))
+                
+                if bad_rows:
+                    st.error(
+                        f"❌ {len(bad_rows)} invalid records, nothing will be imported:\n"
+                        + "\n".join(bad_rows)
+                    )
+                elif st.button("📤 Import Records", use_container_width=True, type="primary"):
+                    if insert_records(rows):
+                        st.session_state.bulk_add_message = f"✅ {len(rows)} records added successfully!"
+                        st.session_state.bulk_upload_key += 1
+                        st.rerun()
+                    else:
+                        st.error("❌ Failed to add records.")
+
 # =====================================================
 # OPERATION: UPDATE RECORD
 # =====================================================
 elif operation == "✏️ Update Record":
     st.header("✏️ Update an Existing Record")
-    st.markdown("---")
+    st.divider()
     
-    df = view_all_records()
+    ids, labels, records = record_options()
     
-    if df.empty:
+    if not ids:
         st.info("No records available to update.")
     else:
-        # Let user select which record to update
+        # Let user select which record to update (labels are pre-built)
         selected_id = st.selectbox(
             "Select a record to update:",
-            options=df["id"].tolist(),
-            format_func=lambda x: f"ID: {x} - {df[df['id'] == x]['name'].values[0]} ({df[df['id'] == x]['email'].values[0]})"
+            options=ids,
+            format_func=labels.__getitem__
         )
         
-        st.markdown("---")
+        st.divider()
         
-        # Fetch the selected record
-        record = view_record_by_id(selected_id)
+        # Reuse the selected record from the loaded data
+        record = records.get(selected_id)
         
         if record:
             name, email, phone, age = record
@@ -364,20 +637,17 @@ elif operation == "✏️ Update Record":
                 
                 # Handle update submission
                 if update_button:
-                    # Validation
-                    if not updated_name.strip():
-                        st.error("❌ Name cannot be empty!")
-                    elif not updated_email.strip():
-                        st.error("❌ Email cannot be empty!")
-                    elif not updated_phone.strip():
-                        st.error("❌ Phone cannot be empty!")
-                    elif "@" not in updated_email:
-                        st.error("❌ Please enter a valid email address!")
-                    elif updated_age < 1:
-                        st.error("❌ Age must be at least 1!")
+                    # Validation: strip once, collect every invalid field
+                    name_s = updated_name.strip()
+                    email_s = updated_email.strip()
+                    phone_s = updated_phone.strip()
+                    errors = validate_record(name_s, email_s, phone_s, updated_age)
+                    
+                    if errors:
+                        st.error("❌ Invalid: " + ", ".join(errors))
                     else:
                         # Update record
-                        if update_record(selected_id, updated_name, updated_email, updated_phone, updated_age):
+                        if update_record(selected_id, name_s, email_s, phone_s, updated_age):
                             st.success(f"✅ Record updated successfully!")
                         else:
                             st.error("❌ Failed to update record.")
@@ -387,24 +657,24 @@ elif operation == "✏️ Update Record":
 # =====================================================
 elif operation == "🗑️ Delete Record":
     st.header("🗑️ Delete a Record")
-    st.markdown("---")
+    st.divider()
     
-    df = view_all_records()
+    ids, labels, records = record_options()
     
-    if df.empty:
+    if not ids:
         st.info("No records available to delete.")
     else:
-        # Let user select which record to delete
+        # Let user select which record to delete (labels are pre-built)
         selected_id = st.selectbox(
             "Select a record to delete:",
-            options=df["id"].tolist(),
-            format_func=lambda x: f"ID: {x} - {df[df['id'] == x]['name'].values[0]} ({df[df['id'] == x]['email'].values[0]})"
+            options=ids,
+            format_func=labels.__getitem__
         )
         
-        st.markdown("---")
+        st.divider()
         
         # Show record details before deleting
-        record = view_record_by_id(selected_id)
+        record = records.get(selected_id)
         
         if record:
             name, email, phone, age = record
@@ -439,7 +709,7 @@ elif operation == "🗑️ Delete Record":
 # =====================================================
 # FOOTER
 # =====================================================
-st.markdown("---")
+st.divider()
 st.markdown(
     """
     <div style='text-align: center; color: #888; font-size: 0.9em;'>